@@ -0,0 +1,119 @@
+"""Micro-benchmarks for the insights path over a stubbed LLM.
+
+Usage:
+    docker exec jeen-insights-api python scripts/bench_insights.py \
+        --rows 5000 --iterations 200 --max-mean-ms 50
+
+The LLM returns a canned JSON payload, so the timing covers only the work
+this repo owns. The end-to-end `generate_insights` call is reported
+together with its two hot stages, dataset summary and response parsing,
+so a regression can be pinned to one of them. With `--max-mean-ms` the
+script exits non-zero when the end-to-end mean exceeds the budget, so it
+can guard regressions in CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+
+# Ensure project root is importable when the script runs as a CLI
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.agent.insight_service import (  # noqa: E402
+    _parse_insights_response,
+    _prepare_dataset_summary,
+    generate_insights,
+)
+
+_LLM_CONTENT = json.dumps({
+    "summary": "North leads sales",
+    "findings": ["North is 40% above average", "East trails by 25%"],
+    "suggestions": ["Expand north inventory"],
+})
+
+
+def _fake_llm() -> SimpleNamespace:
+    async def generate(**kwargs):
+        return {"content": _LLM_CONTENT}
+
+    return SimpleNamespace(generate=generate)
+
+
+def _dataset(rows: int) -> Dict[str, Any]:
+    regions = ["north", "south", "east", "west"]
+    return {
+        "columns": ["region", "product", "sales", "units"],
+        "rows": [
+            [regions[i % 4], f"p{i % 97}", float(i * 13 % 1000), i % 50]
+            for i in range(rows)
+        ],
+    }
+
+
+def _time(fn: Callable[[], Any], iterations: int) -> List[float]:
+    fn()
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def _time_generate(dataset: Dict[str, Any], iterations: int) -> List[float]:
+    llm = _fake_llm()
+    context = {"documentation": ["Sales are reported in USD"]}
+    await generate_insights(dataset, context, "warm-up", llm)
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await generate_insights(dataset, context, "Which region sells most?", llm)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def run(rows: int, iterations: int) -> Dict[str, List[float]]:
+    dataset = _dataset(rows)
+    df = pd.DataFrame(dataset["rows"], columns=dataset["columns"])
+    fenced = f"```json\n{_LLM_CONTENT}\n```"
+    return {
+        "generate_insights": asyncio.run(_time_generate(dataset, iterations)),
+        "dataset_summary": _time(lambda: _prepare_dataset_summary(df), iterations),
+        "parse_response": _time(lambda: _parse_insights_response(fenced), iterations),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--max-mean-ms", type=float, default=None,
+                        help="fail when the mean latency exceeds this budget")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.iterations)
+    print(f"rows: {args.rows}  iterations: {args.iterations}")
+    for name, timings in results.items():
+        print(
+            f"{name:<18} mean: {statistics.fmean(timings):.3f}ms  "
+            f"min: {min(timings):.3f}ms  max: {max(timings):.3f}ms"
+        )
+    mean = statistics.fmean(results["generate_insights"])
+    if args.max_mean_ms is not None and mean > args.max_mean_ms:
+        print(f"FAIL: mean {mean:.2f}ms exceeds budget {args.max_mean_ms:.2f}ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
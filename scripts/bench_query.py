@@ -0,0 +1,146 @@
+"""Concurrent latency driver for the `/api/query` endpoint.
+
+Usage:
+    python scripts/bench_query.py --connection <source_key> \
+        --concurrency 20 --requests 100 "show monthly sales" "top 10 products"
+    python scripts/bench_query.py --connection <source_key> --questions-file questions.json
+
+Fires the given questions round-robin against a running API, keeping
+`--concurrency` requests in flight, and prints p50 / p95 / p99 latency
+of the successful (200) requests; failures are counted separately.
+A questions file is a JSON array of strings, so a question set can be
+kept and versioned without editing this script. `--jsonl` appends each
+request's question, status and latency as it completes.
+Useful as a quick regression harness for tail latency; it is not a unit
+test and is never collected by pytest.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+from itertools import cycle, islice
+from typing import BinaryIO, List, Optional, Tuple
+
+import httpx
+import orjson
+
+DEFAULT_QUESTIONS = ["show total sales by year"]
+
+
+async def _one(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    connection: str,
+    question: str,
+    sink: Optional[BinaryIO] = None,
+) -> Tuple[float, int]:
+    async with sem:
+        start = time.perf_counter()
+        try:
+            response = await client.post(
+                "/api/query", json={"question": question, "connection": connection}
+            )
+            status = response.status_code
+        except httpx.HTTPError:
+            status = 0
+        latency = time.perf_counter() - start
+    if sink is not None:
+        # One line per request as it completes, so an interrupted run keeps
+        # everything measured so far.
+        sink.write(orjson.dumps({"question": question, "status": status, "latency": latency}))
+        sink.write(b"\n")
+        sink.flush()
+    return latency, status
+
+
+async def run(
+    base_url: str,
+    connection: str,
+    questions: List[str],
+    total: int,
+    concurrency: int,
+    jsonl_path: Optional[str] = None,
+) -> None:
+    sem = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    sink = open(jsonl_path, "ab") if jsonl_path else None
+    try:
+        async with httpx.AsyncClient(base_url=base_url, timeout=120.0, limits=limits) as client:
+            started = time.perf_counter()
+            results = await asyncio.gather(
+                *(
+                    _one(client, sem, connection, q, sink)
+                    for q in islice(cycle(questions), total)
+                )
+            )
+            wall = time.perf_counter() - started
+    finally:
+        if sink is not None:
+            sink.close()
+
+    # Failures are usually fast (refused) or pinned at the timeout, so they
+    # would skew the percentiles either way; they are reported as counts.
+    latencies = sorted(latency for latency, status in results if status == 200)
+    statuses = Counter(status for _, status in results)
+    failures = total - statuses[200]
+    print(f"requests: {total}  concurrency: {concurrency}  failures: {failures}")
+    if failures:
+        # 0 stands for a transport error (timeout, refused connection).
+        print("statuses: " + "  ".join(f"{code}={n}" for code, n in sorted(statuses.items())))
+    print(f"wall: {wall:.2f}s  throughput: {total / wall:.2f} req/s")
+    if len(latencies) >= 2:
+        pct = statistics.quantiles(latencies, n=100)
+        print(f"p50: {pct[49]:.3f}s  p95: {pct[94]:.3f}s  p99: {pct[98]:.3f}s")
+    elif latencies:
+        print(f"latency: {latencies[0]:.3f}s")
+    else:
+        print("latency: n/a (no successful requests)")
+
+
+def _load_questions(parser: argparse.ArgumentParser, path: str) -> List[str]:
+    try:
+        with open(path, "rb") as fh:
+            loaded = orjson.loads(fh.read())
+    except (OSError, orjson.JSONDecodeError) as e:
+        parser.error(f"--questions-file {path}: {e}")
+    if not isinstance(loaded, list) or not all(isinstance(q, str) for q in loaded):
+        parser.error(f"--questions-file {path}: expected a JSON array of strings")
+    return loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("questions", nargs="*")
+    parser.add_argument("--questions-file", help="JSON array of questions to add")
+    parser.add_argument("--base-url", default="http://localhost:8001")
+    parser.add_argument("--connection", required=True, help="source_key to query")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=50, dest="total")
+    parser.add_argument("--jsonl", help="append one JSON line per request to this file")
+    args = parser.parse_args()
+    if args.total < 1:
+        parser.error("--requests must be at least 1")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    questions = list(args.questions)
+    if args.questions_file:
+        questions.extend(_load_questions(parser, args.questions_file))
+    asyncio.run(
+        run(
+            args.base_url,
+            args.connection,
+            questions or DEFAULT_QUESTIONS,
+            args.total,
+            args.concurrency,
+            args.jsonl,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 
 from typing import Dict, Any, List
 import json
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
@@ -134,7 +135,7 @@ def _prepare_dataset_summary(df: pd.DataFrame) -> Dict[str, Any]:
             stats_parts.append(f"  - Unique values: {unique_count}")
             
             # Top 3 values
-            top_values = df[col].value_counts().head(3)
+            top_values = _top_k(df[col], 3)
             if not top_values.empty:
                 stats_parts.append(f"  - Top values: {', '.join([str(v) for v in top_values.index])}")
     
@@ -143,6 +144,18 @@ def _prepare_dataset_summary(df: pd.DataFrame) -> Dict[str, Any]:
     return summary
 
 
+def _top_k(series: pd.Series, k: int = 3) -> pd.Series:
+    """
+    Return the k most frequent values of a series, most frequent first.
+    Avoids sorting the full value_counts() on high-cardinality columns.
+    """
+    counts = series.value_counts(sort=False)
+    if len(counts) <= k:
+        return counts.sort_values(ascending=False, kind="stable")
+    idx = np.argpartition(-counts.to_numpy(), k)[:k]
+    return counts.iloc[idx].sort_values(ascending=False, kind="stable")
+
+
 def _build_insight_prompt(
     dataset_summary: Dict[str, Any],
     context: Dict[str, Any],
@@ -38,20 +38,20 @@ async def generate_profile_report(dataset: Dict[str, Any]) -> str:
         # Preprocess dataset (remove currency signs, combine date columns)
         df, original_columns = preprocess_dataset(dataset)
         
-        logger.info(f"Generating profile report for dataset: {len(df)} rows, {len(df.columns)} columns")
+        logger.info("Generating profile report for dataset: %d rows, %d columns", len(df), len(df.columns))
         
         # Determine profiling mode based on dataset size
         row_count = len(df)
         
         if row_count > 100000:
             # Very large dataset - sample and use minimal mode
-            logger.warning(f"Large dataset ({row_count:,} rows). Sampling 10,000 rows.")
+            logger.warning("Large dataset (%d rows). Sampling 10,000 rows.", row_count)
             df_to_profile = df.sample(min(10000, row_count), random_state=42)
             minimal_mode = True
             explorative_mode = False
         elif row_count > 10000:
             # Large dataset - use minimal mode
-            logger.info(f"Dataset has {row_count:,} rows. Using minimal profiling mode.")
+            logger.info("Dataset has %d rows. Using minimal profiling mode.", row_count)
             df_to_profile = df
             minimal_mode = True
             explorative_mode = False
@@ -92,15 +92,15 @@ async def generate_profile_report(dataset: Dict[str, Any]) -> str:
         # Convert to HTML
         html_report = profile.to_html()
         
-        logger.info(f"Profile report generated successfully: {len(html_report)} bytes")
+        logger.info("Profile report generated successfully: %d bytes", len(html_report))
         
         return html_report
         
     except ValueError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Failed to generate profile report: {e}", exc_info=True)
+        logger.error("Failed to generate profile report: %s", e, exc_info=True)
         raise Exception(f"Profile generation failed: {str(e)}")
 
 
@@ -27,7 +27,7 @@ def preprocess_dataset(dataset: Dict[str, Any]) -> Tuple[pd.DataFrame, List[str]
     df = pd.DataFrame(rows, columns=columns)
     original_columns = columns.copy()
     
-    logger.info(f"Preprocessing dataset: {len(df)} rows, {len(df.columns)} columns")
+    logger.info("Preprocessing dataset: %d rows, %d columns", len(df), len(df.columns))
     
     # Step 1: Remove currency signs from columns
     df = remove_currency_signs(df)
@@ -35,7 +35,7 @@ def preprocess_dataset(dataset: Dict[str, Any]) -> Tuple[pd.DataFrame, List[str]
     # Step 2: Combine year/month columns if they exist
     df = combine_date_columns(df)
     
-    logger.info(f"After preprocessing: {len(df)} rows, {len(df.columns)} columns")
+    logger.info("After preprocessing: %d rows, %d columns", len(df), len(df.columns))
     
     return df, original_columns
 
@@ -60,7 +60,7 @@ def remove_currency_signs(df: pd.DataFrame) -> pd.DataFrame:
             has_currency = sample.astype(str).str.contains(currency_pattern).any()
             
             if has_currency:
-                logger.info(f"Removing currency signs from column: {col}")
+                logger.info("Removing currency signs from column: %s", col)
                 # Remove currency symbols and commas
                 cleaned = df[col].astype(str).str.replace(currency_pattern, '', regex=True).str.strip()
                 # Try to convert to numeric
@@ -140,7 +140,7 @@ def combine_date_columns(df: pd.DataFrame) -> pd.DataFrame:
     
     # If we have year and month, combine them
     if year_col and month_col:
-        logger.info(f"Combining date columns: year={year_col}, month={month_col}")
+        logger.info("Combining date columns: year=%s, month=%s", year_col, month_col)
         
         try:
             # Convert month to numeric if it's a name
@@ -174,13 +174,13 @@ def combine_date_columns(df: pd.DataFrame) -> pd.DataFrame:
             cols = ['date'] + [c for c in df.columns if c != 'date']
             df = df[cols]
             
-            logger.info(f"Created combined 'date' column, removed: {cols_to_drop}")
+            logger.info("Created combined 'date' column, removed: %s", cols_to_drop)
             
         except Exception as e:
-            logger.warning(f"Failed to combine date columns: {e}")
+            logger.warning("Failed to combine date columns: %s", e)
     
     elif year_col and quarter_col:
-        logger.info(f"Combining date columns: year={year_col}, quarter={quarter_col}")
+        logger.info("Combining date columns: year=%s, quarter=%s", year_col, quarter_col)
         
         try:
             # Year/Quarter format
@@ -193,10 +193,10 @@ def combine_date_columns(df: pd.DataFrame) -> pd.DataFrame:
             cols = ['date'] + [c for c in df.columns if c != 'date']
             df = df[cols]
             
-            logger.info(f"Created combined 'date' column from year and quarter")
+            logger.info("Created combined 'date' column from year and quarter")
             
         except Exception as e:
-            logger.warning(f"Failed to combine year/quarter columns: {e}")
+            logger.warning("Failed to combine year/quarter columns: %s", e)
     
     return df
 
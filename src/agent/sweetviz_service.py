@@ -40,14 +40,14 @@ async def generate_sweetviz_report(dataset: Dict[str, Any]) -> str:
         # Preprocess dataset (remove currency signs, combine date columns)
         df, original_columns = preprocess_dataset(dataset)
         
-        logger.info(f"Generating Sweetviz report for dataset: {len(df)} rows, {len(df.columns)} columns")
+        logger.info("Generating Sweetviz report for dataset: %d rows, %d columns", len(df), len(df.columns))
         
         # Determine if sampling is needed for large datasets
         row_count = len(df)
         
         if row_count > 100000:
             # Very large dataset - sample
-            logger.warning(f"Large dataset ({row_count:,} rows). Sampling 10,000 rows.")
+            logger.warning("Large dataset (%d rows). Sampling 10,000 rows.", row_count)
             df_to_profile = df.sample(min(10000, row_count), random_state=42)
         else:
             df_to_profile = df
@@ -81,13 +81,13 @@ async def generate_sweetviz_report(dataset: Dict[str, Any]) -> str:
             if os.path.exists(tmp_path):
                 os.remove(tmp_path)
         
-        logger.info(f"Sweetviz report generated successfully: {len(html_report)} bytes")
+        logger.info("Sweetviz report generated successfully: %d bytes", len(html_report))
         
         return html_report
         
     except ValueError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Failed to generate Sweetviz report: {e}", exc_info=True)
+        logger.error("Failed to generate Sweetviz report: %s", e, exc_info=True)
         raise Exception(f"Sweetviz report generation failed: {str(e)}")
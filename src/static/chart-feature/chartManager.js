@@ -172,16 +172,18 @@ export class ChartManager {
         // Show visual feedback
         this.showToast(`Generating ${chartType === 'auto' ? 'LLM-recommended' : chartType} chart...`, 'info');
         
-        // Regenerate chart with new type
-        await this.generateChartWithLLM(chartType);
+        // Regenerate chart with new type, bypassing the UI server's Redis cache too
+        await this.generateChartWithLLM(chartType, { force: true });
     }
     
     /**
      * Generates chart using LLM
      * 
      * @param {string} chartType - Chart type ("auto" for LLM choice, or specific type)
+     * @param {Object} [options]
+     * @param {boolean} [options.force=false] - Skip the server-side response cache
      */
-    async generateChartWithLLM(chartType = 'auto') {
+    async generateChartWithLLM(chartType = 'auto', { force = false } = {}) {
         console.log('[ChartManager] Generating chart with LLM, type:', chartType);
 
         // Regenerating from scratch — clear any prior chat-edit state so the
@@ -234,7 +236,8 @@ export class ChartManager {
             
             // Call LLM API
             const connection = (typeof getActiveConnection === 'function') ? getActiveConnection() : '';
-            const response = await fetch('/api/generate-chart', {
+            const url = force ? '/api/generate-chart?cache=false' : '/api/generate-chart';
+            const response = await fetch(url, {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({
@@ -50,6 +50,11 @@ def is_read_only_sql(sql: str) -> bool:
     return bool(_ALLOWED_LEAD_KEYWORDS.match(cleaned))
 
 
+def _error_result(message: str) -> Dict[str, Any]:
+    """Build the empty result shape `run_sql` returns alongside an error."""
+    return {"error": message, "columns": [], "rows": [], "row_count": 0}
+
+
 class PostgresSqlRunner:
     """
     PostgreSQL SQL runner for executing queries.
@@ -101,15 +106,10 @@ class PostgresSqlRunner:
                 "run_sql: blocked non-read-only SQL (first 80 chars): %s",
                 (sql or "").strip()[:80],
             )
-            return {
-                "error": (
-                    "Only read-only queries are allowed. The query must start "
-                    "with SELECT or WITH."
-                ),
-                "columns": [],
-                "rows": [],
-                "row_count": 0,
-            }
+            return _error_result(
+                "Only read-only queries are allowed. The query must start "
+                "with SELECT or WITH."
+            )
 
         # Add LIMIT if not present (only safe to do for the SELECT/WITH
         # statements this runner accepts).
@@ -135,22 +135,12 @@ class PostgresSqlRunner:
             # The READ ONLY transaction rejected something the pre-check
             # accepted (e.g. a SELECT that calls a function with side effects).
             logger.warning("run_sql: read-only transaction rejected query: %s", e)
-            return {
-                "error": (
-                    "This query attempted to modify the database and was "
-                    "blocked. Only read-only queries are allowed."
-                ),
-                "columns": [],
-                "rows": [],
-                "row_count": 0,
-            }
+            return _error_result(
+                "This query attempted to modify the database and was "
+                "blocked. Only read-only queries are allowed."
+            )
         except Exception as e:  # noqa: BLE001
-            return {
-                "error": str(e),
-                "columns": [],
-                "rows": [],
-                "row_count": 0,
-            }
+            return _error_result(str(e))
     
     async def get_table_schema(self, table_name: str) -> List[Dict[str, Any]]:
         """Get schema information for a table."""
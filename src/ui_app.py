@@ -7,65 +7,414 @@ forwards it on without inspecting it.
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import http.cookiejar
 import logging
 import os
-from typing import Any, Dict
-
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterator, Tuple
+from urllib.parse import urlencode
+
+import orjson
+import redis
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import Flask, Response, jsonify, render_template, request, stream_with_context
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
+from jinja2 import FileSystemBytecodeCache
 
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    `request.get_json()` on chart / insights / profile payloads decodes whole
+    datasets; orjson does that several times faster than the stdlib.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 app = Flask(__name__, template_folder="templates", static_folder="static")
+app.json = OrjsonProvider(app)
+
+# Compress JSON / HTML bodies (profile reports, large result sets) on the way
+# out, chunk by chunk for streamed relays. text/event-stream is deliberately
+# not listed: buffering SSE inside a compressor would stall live insights.
+app.config.update(
+    COMPRESS_MIMETYPES=["application/json", "text/html", "text/css", "application/javascript"],
+    COMPRESS_ALGORITHM=["br", "gzip"],
+    COMPRESS_ALGORITHM_STREAMING=["br", "deflate"],
+    COMPRESS_LEVEL=5,
+    COMPRESS_BR_LEVEL=5,
+    COMPRESS_MIN_SIZE=1024,
+)
+Compress(app)
+
+# Share compiled templates across gunicorn workers and restarts, and compile
+# index.html at import so no request pays for it.
+# Without JINJA_CACHE, Jinja picks its own per-user directory (mode 0700,
+# ownership checked): cached bytecode is executed, so the directory must not
+# be one another local user could create or write first.
+_JINJA_CACHE_DIR = os.getenv("JINJA_CACHE")
+if _JINJA_CACHE_DIR:
+    os.makedirs(_JINJA_CACHE_DIR, mode=0o700, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=_JINJA_CACHE_DIR)
+app.jinja_env.get_template("index.html")
 
 API_BASE_URL = os.getenv("API_BASE_URL", "http://jeen-insights-api:8000")
 
+# One pooled session for every backend call, so keep-alive connections to
+# the API are reused instead of paying a TCP handshake per proxied request.
+# Retries only cover failures to connect: once a request has reached the API
+# it is never replayed, so a read timeout costs one timeout (not four, each
+# repeating the backend work), an HTTP error status (e.g. a 503 "registry not
+# ready") is relayed once with its detail, and LLM POSTs never run twice.
+# Under gevent a worker can have many calls in flight at once; size the pool
+# to that fan-out so concurrent calls keep their sockets instead of churning
+# through new ones.
+BACKEND_POOL_SIZE = int(os.getenv("BACKEND_POOL_SIZE", "50"))
+
+
+def _backend_session(pool_size: int, max_retries: Retry) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=max_retries
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # Sessions only ever talk to our own API. Skip requests' per-call proxy
+    # env / ~/.netrc lookups, and never keep cookies: a shared session would
+    # replay them on behalf of unrelated browser users.
+    session.trust_env = False
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    # Close pooled sockets on worker exit rather than leaving them half-open
+    # on the API. Draining in-flight requests on SIGTERM is gunicorn's job
+    # (see --graceful-timeout in Dockerfile.ui); a signal handler here would
+    # replace the worker's own.
+    atexit.register(session.close)
+    return session
+
+
+SESSION = _backend_session(
+    BACKEND_POOL_SIZE, Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.1)
+)
+# Single-attempt session for the /health probe: a stalled backend must cost
+# one timeout, not four plus backoff, while the probe holds `_health_lock`.
+PROBE_SESSION = _backend_session(2, Retry(total=0, read=False))
+
+# Successful upstream bodies are relayed in 64 KiB chunks rather than parsed
+# and re-serialised; profile reports and large result sets can run to MBs.
+_RELAY_CHUNK_SIZE = 64 * 1024
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Browser cache lifetime for the read-only table list / schema lookups, so
+# repeated reads are served by the browser without a round-trip through the
+# proxy. `tables-rich` is deliberately excluded: the UI re-reads it right
+# after a metadata refresh.
+METADATA_CACHE_CONTROL = f"private, max-age={int(os.getenv('METADATA_CACHE_MAX_AGE', '30'))}"
+
+# Optional Redis cache for chart generation, the one slow LLM-backed endpoint
+# whose answer is a pure function of its payload. /api/ask is never cached:
+# each answer carries its own query_id and metrics and must be logged to
+# history. /api/generate-insights reports LLM failures as a 200 fallback.
+# Disabled unless REDIS_URL is set; a Redis error is treated as a cache miss
+# so the UI never fails because the cache is down.
+REDIS_URL = os.getenv("REDIS_URL")
+RCACHE = redis.Redis.from_url(REDIS_URL, socket_timeout=0.25) if REDIS_URL else None
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "3600"))
+# After a Redis error the cache is bypassed for this many seconds, so a down
+# or stalled Redis costs one socket timeout per window, not one per request.
+CACHE_RETRY_AFTER = float(os.getenv("CACHE_RETRY_AFTER", "30"))
+_cache_skip_until = 0.0
+
 
 # ----------------------------------------------------------------------
 # Helpers
 # ----------------------------------------------------------------------
-def _proxy_get(path: str, params: Dict[str, Any] | None = None, timeout: float = 30) -> Any:
+def _send(
+    method: str,
+    path: str,
+    *,
+    timeout: float,
+    params: Dict[str, Any] | None = None,
+    payload: Dict[str, Any] | None = None,
+    stream: bool = True,
+    retries: bool = True,
+) -> requests.Response:
+    """Issue one backend call through the pooled SESSION.
+
+    Every proxy route goes through here. Raises `requests.RequestException`
+    when the API cannot be reached; callers turn that into `_unavailable`.
+    `retries=False` makes exactly one attempt (via PROBE_SESSION).
+    """
+    session = SESSION if retries else PROBE_SESSION
+    return session.request(
+        method,
+        f"{API_BASE_URL}{path}",
+        params=params,
+        data=None if payload is None else orjson.dumps(payload),
+        headers=None if payload is None else _JSON_HEADERS,
+        timeout=timeout,
+        stream=stream,
+    )
+
+
+def _unavailable(method: str, path: str, e: Exception) -> Any:
+    logger.error("Backend %s %s failed: %s", method, path, e)
+    return jsonify({"error": f"Backend unavailable: {e}"}), 503
+
+
+def _iter_upstream(upstream: requests.Response, chunk_size: int) -> Iterator[bytes]:
     try:
-        response = requests.get(f"{API_BASE_URL}{path}", params=params, timeout=timeout)
+        for chunk in upstream.iter_content(chunk_size=chunk_size):
+            if chunk:
+                yield chunk
+    finally:
+        upstream.close()
+
+
+def _relay(upstream: requests.Response) -> Any:
+    """Answer with the upstream response, passing its body through untouched."""
+    if upstream.status_code != 200:
+        body = upstream.text
+        upstream.close()
+        return jsonify({"error": body}), upstream.status_code
+    return Response(
+        stream_with_context(_iter_upstream(upstream, _RELAY_CHUNK_SIZE)),
+        status=200,
+        content_type=upstream.headers.get("Content-Type", "application/json"),
+    )
+
+
+class _SingleFlight:
+    """Collapse concurrent calls for the same key into one execution.
+
+    The first caller runs `fn`; callers arriving while it is in flight wait
+    for and share its result (or exception). Nothing is kept afterwards.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+# When the UI opens a schema browser it can fire the same table / schema
+# lookups concurrently; those share a single backend call.
+_METADATA_FLIGHTS = _SingleFlight()
+
+
+def _get_buffered(path: str, params: Dict[str, Any] | None, timeout: float) -> Tuple[int, str, bytes]:
+    response = _send("GET", path, params=params, timeout=timeout, stream=False)
+    content_type = response.headers.get("Content-Type", "application/json")
+    return response.status_code, content_type, response.content
+
+
+def _proxy_get_cacheable(
+    path: str, params: Dict[str, Any] | None, timeout: float, cache_control: str
+) -> Any:
+    """GET cacheable metadata: coalesced upstream call, ETag, Cache-Control.
+
+    A request whose If-None-Match matches gets a bodiless 304.
+    """
+    key = f"{path}?{urlencode(sorted((params or {}).items()))}"
+    try:
+        status, content_type, body = _METADATA_FLIGHTS.do(
+            key, lambda: _get_buffered(path, params, timeout)
+        )
     except requests.exceptions.RequestException as e:
-        logger.error("Backend GET %s failed: %s", path, e)
-        return jsonify({"error": f"Backend unavailable: {e}"}), 503
-    if response.status_code == 200:
-        return jsonify(response.json())
-    return jsonify({"error": response.text}), response.status_code
+        return _unavailable("GET", path, e)
+    if status != 200:
+        return jsonify({"error": body.decode("utf-8", errors="replace")}), status
+    response = Response(body, content_type=content_type)
+    response.set_etag(hashlib.md5(body, usedforsecurity=False).hexdigest(), weak=True)
+    response.headers["Cache-Control"] = cache_control
+    return response.make_conditional(request)
+
+
+def _cache_key(prefix: str, payload: Dict[str, Any]) -> str:
+    canonical = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return f"{prefix}:{hashlib.sha1(canonical).hexdigest()}"
+
 
+def _cache_available() -> bool:
+    return RCACHE is not None and time.monotonic() >= _cache_skip_until
+
+
+def _cache_failed(op: str, key: str, e: Exception) -> None:
+    global _cache_skip_until
+    _cache_skip_until = time.monotonic() + CACHE_RETRY_AFTER
+    logger.warning(
+        "Response cache %s %s failed, bypassing cache for %.0fs: %s", op, key, CACHE_RETRY_AFTER, e
+    )
+
+
+def _cache_get(key: str) -> bytes | None:
+    try:
+        return RCACHE.get(key)
+    except redis.RedisError as e:
+        _cache_failed("GET", key, e)
+        return None
+
+
+def _cacheable(body: bytes) -> bool:
+    """A 200 can still carry a failure (`{"error": ...}`); never cache those."""
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return False
+    return not (isinstance(data, dict) and data.get("error"))
+
+
+def _cache_set(key: str, body: bytes) -> None:
+    if not _cache_available():
+        return
+    try:
+        RCACHE.set(key, body, ex=RESPONSE_CACHE_TTL)
+    except redis.RedisError as e:
+        _cache_failed("SET", key, e)
+
+
+def _proxy_get(
+    path: str,
+    params: Dict[str, Any] | None = None,
+    timeout: float = 30,
+    cache_control: str | None = None,
+) -> Any:
+    """GET `path` from the API and relay the answer.
+
+    With `cache_control`, the response is cacheable metadata: it is sent
+    with that Cache-Control header and an ETag for cheap revalidation.
+    """
+    if cache_control:
+        return _proxy_get_cacheable(path, params, timeout, cache_control)
+    try:
+        response = _send("GET", path, params=params, timeout=timeout)
+    except requests.exceptions.RequestException as e:
+        return _unavailable("GET", path, e)
+    return _relay(response)
+
+
+def _proxy_post(
+    path: str,
+    payload: Dict[str, Any],
+    timeout: float = 60,
+    cache_prefix: str | None = None,
+) -> Any:
+    """POST `payload` to the API and relay the answer.
+
+    With `cache_prefix`, successful responses (200 without an `error` in the
+    body) are cached in Redis keyed by the full payload; `?cache=false` on the
+    incoming request skips the lookup and replaces the entry with the fresh
+    answer.
+    """
+    key = None
+    if cache_prefix and _cache_available():
+        key = _cache_key(cache_prefix, payload)
+        cached = _cache_get(key) if request.args.get("cache") != "false" else None
+        if cached is not None:
+            logger.info("cache_hit %s", key)
+            return Response(cached, content_type="application/json")
 
-def _proxy_post(path: str, payload: Dict[str, Any], timeout: float = 60) -> Any:
     try:
-        response = requests.post(f"{API_BASE_URL}{path}", json=payload, timeout=timeout)
+        response = _send("POST", path, payload=payload, timeout=timeout)
     except requests.exceptions.RequestException as e:
-        logger.error("Backend POST %s failed: %s", path, e)
-        return jsonify({"error": f"Backend unavailable: {e}"}), 503
-    if response.status_code == 200:
-        return jsonify(response.json())
-    return jsonify({"error": response.text}), response.status_code
+        return _unavailable("POST", path, e)
+
+    if key is not None and response.status_code == 200:
+        body = response.content
+        if _cacheable(body):
+            _cache_set(key, body)
+        return Response(body, content_type=response.headers.get("Content-Type", "application/json"))
+    return _relay(response)
 
 
 # ----------------------------------------------------------------------
 # Pages
 # ----------------------------------------------------------------------
+# index.html has no per-request context, so it is rendered once and then
+# served from memory. Debug mode re-renders so template edits show up.
+_INDEX_HTML: str | None = None
+
+
 @app.route("/")
 def index():
-    return render_template("index.html")
+    global _INDEX_HTML
+    if app.debug:
+        return render_template("index.html")
+    if _INDEX_HTML is None:
+        _INDEX_HTML = render_template("index.html")
+    return Response(
+        _INDEX_HTML,
+        mimetype="text/html",
+        headers={"Cache-Control": "public, max-age=300"},
+    )
+
+
+# Load-balancer probes hit /health every few seconds per replica. The backend
+# status is cached for HEALTH_TTL_MS (failures for half that) so probe volume
+# does not turn into backend calls one-for-one.
+HEALTH_TTL = int(os.getenv("HEALTH_TTL_MS", "1000")) / 1000
+_health_cache: Dict[str, Any] = {"expires": 0.0, "backend_status": None}
+_health_lock = threading.Lock()
+
+
+def _backend_health() -> Dict[str, Any]:
+    if time.monotonic() < _health_cache["expires"]:
+        return _health_cache["backend_status"]
+    with _health_lock:
+        # Another request may have refreshed the entry while we waited.
+        if time.monotonic() < _health_cache["expires"]:
+            return _health_cache["backend_status"]
+        try:
+            response = _send("GET", "/health", timeout=0.5, stream=False, retries=False)
+            healthy = response.status_code == 200
+            backend_status = response.json() if healthy else {"status": "unhealthy"}
+        except Exception as e:  # noqa: BLE001
+            healthy = False
+            backend_status = {"status": "unhealthy", "error": str(e)}
+        ttl = HEALTH_TTL if healthy else HEALTH_TTL / 2
+        _health_cache.update(expires=time.monotonic() + ttl, backend_status=backend_status)
+        return backend_status
 
 
 @app.route("/health")
 def health():
-    try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=5)
-        backend_status = response.json() if response.status_code == 200 else {"status": "unhealthy"}
-    except Exception as e:  # noqa: BLE001
-        backend_status = {"status": "unhealthy", "error": str(e)}
-    return jsonify({"ui_status": "healthy", "backend_status": backend_status})
+    return jsonify({"ui_status": "healthy", "backend_status": _backend_health()})
 
 
 # ----------------------------------------------------------------------
@@ -118,7 +467,12 @@ def get_tables():
     connection = request.args.get("connection")
     if not connection:
         return jsonify({"error": "No connection selected"}), 400
-    return _proxy_get("/api/tables", params={"connection": connection}, timeout=15)
+    return _proxy_get(
+        "/api/tables",
+        params={"connection": connection},
+        timeout=15,
+        cache_control=METADATA_CACHE_CONTROL,
+    )
 
 
 @app.route("/api/tables-rich", methods=["GET"])
@@ -134,7 +488,12 @@ def get_schema(table_name: str):
     connection = request.args.get("connection")
     if not connection:
         return jsonify({"error": "No connection selected"}), 400
-    return _proxy_get(f"/api/schema/{table_name}", params={"connection": connection}, timeout=15)
+    return _proxy_get(
+        f"/api/schema/{table_name}",
+        params={"connection": connection},
+        timeout=15,
+        cache_control=METADATA_CACHE_CONTROL,
+    )
 
 
 # ----------------------------------------------------------------------
@@ -208,7 +567,7 @@ def generate_chart():
     data = request.get_json() or {}
     if not data.get("connection"):
         return jsonify({"error": "No connection selected"}), 400
-    return _proxy_post("/api/generate-chart", data)
+    return _proxy_post("/api/generate-chart", data, cache_prefix="chart")
 
 
 @app.route("/api/generate-insights", methods=["POST"])
@@ -230,30 +589,19 @@ def generate_insights_stream():
     if not data.get("connection"):
         return jsonify({"error": "No connection selected"}), 400
 
-    upstream = requests.post(
-        f"{API_BASE_URL}/api/generate-insights/stream",
-        json=data,
-        stream=True,
-        timeout=120,
-    )
+    path = "/api/generate-insights/stream"
+    try:
+        upstream = _send("POST", path, payload=data, timeout=120)
+    except requests.exceptions.RequestException as e:
+        return _unavailable("POST", path, e)
 
     if upstream.status_code != 200:
         # Surface the upstream error verbatim; don't try to re-stream.
-        body = upstream.text
-        upstream.close()
-        return jsonify({"error": body}), upstream.status_code
-
-    def relay():
-        try:
-            # Small chunk size so the first byte arrives ASAP.
-            for chunk in upstream.iter_content(chunk_size=64):
-                if chunk:
-                    yield chunk
-        finally:
-            upstream.close()
+        return _relay(upstream)
 
     return Response(
-        stream_with_context(relay()),
+        # Small chunk size so the first byte arrives ASAP.
+        stream_with_context(_iter_upstream(upstream, 64)),
         mimetype="text/event-stream",
         headers={
             "Cache-Control": "no-cache, no-transform",
@@ -0,0 +1,156 @@
+"""Tests for `src.agent.insight_service`.
+
+The LLM is never called: `generate_insights` receives a stub whose
+`generate` coroutine returns canned content.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pandas as pd
+import pytest
+
+from src.agent.insight_service import _prepare_dataset_summary, _top_k, generate_insights
+
+# Canned LLM payloads are serialized once at import; tests only read them.
+_INSIGHTS = {
+    "summary": "North leads sales",
+    "findings": ["North is 40% above average"],
+    "suggestions": ["Expand north inventory"],
+}
+_INSIGHTS_JSON = orjson.dumps(_INSIGHTS).decode()
+# Ways the model has been seen to wrap its JSON answer.
+_WRAPPERS = {
+    "plain": "{}",
+    "json-fence": "```json\n{}\n```",
+    "bare-fence": "```\n{}\n```",
+    "prose": "Here is the analysis:\n{}\nLet me know if you need more.",
+}
+
+# Tuples so a test that mutates the shared sample fails loudly. The outer
+# mapping stays a dict: generate_insights dispatches on isinstance(dict),
+# which a MappingProxyType would not satisfy.
+_DATASET = {
+    "columns": ("region", "sales"),
+    "rows": (("north", 140), ("south", 90), ("east", 70)),
+}
+
+
+def _fake_llm(content: str) -> SimpleNamespace:
+    """LLM stub whose `generate` returns *content* and records its kwargs."""
+    calls = []
+
+    async def generate(**kwargs):
+        calls.append(kwargs)
+        return {"content": content}
+
+    return SimpleNamespace(generate=generate, calls=calls)
+
+
+async def _bulk_generate(llm, questions, concurrency: int = 8) -> list:
+    """Run generate_insights for every question, at most *concurrency* at once."""
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(question):
+        async with sem:
+            return await generate_insights(_DATASET, {}, question, llm)
+
+    return await asyncio.gather(*map(_one, questions))
+
+
+def _assert_insights(result: dict, *, summary=None, findings=None, suggestions=None) -> None:
+    """Check the response shape every caller relies on, plus any given fields."""
+    assert isinstance(result["summary"], str)
+    assert isinstance(result["findings"], list)
+    assert isinstance(result["suggestions"], list)
+    assert result["prompt"] and result["system_message"]
+    if summary is not None:
+        assert result["summary"] == summary
+    if findings is not None:
+        assert result["findings"] == findings
+    if suggestions is not None:
+        assert result["suggestions"] == suggestions
+
+
+def test_top_k_orders_by_frequency():
+    series = pd.Series(list("abbcccddddeeeee") + [None])
+    top = _top_k(series, 3)
+    assert list(top.index) == ["e", "d", "c"]
+    assert list(top.values) == [5, 4, 3]
+
+
+def test_top_k_matches_value_counts_on_high_cardinality():
+    values = [f"v{i}" for i in range(5_000)] + ["hot"] * 30 + ["warm"] * 20 + ["mild"] * 10
+    series = pd.Series(values)
+    top = _top_k(series, 3)
+    assert list(top.index) == list(series.value_counts().head(3).index)
+    assert list(top.values) == [30, 20, 10]
+
+
+def test_top_k_fewer_values_than_k():
+    top = _top_k(pd.Series(["x", "y", "y"]), 3)
+    assert list(top.index) == ["y", "x"]
+
+
+def test_dataset_summary_lists_top_values():
+    df = pd.DataFrame({"region": ["north", "south", "south", "east"], "sales": [1, 2, 3, 4]})
+    summary = _prepare_dataset_summary(df)
+    assert "Top values: south" in summary["column_stats"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("wrapper", list(_WRAPPERS.values()), ids=list(_WRAPPERS))
+async def test_generate_insights_parses_llm_json(wrapper):
+    llm = _fake_llm(wrapper.format(_INSIGHTS_JSON))
+    result = await generate_insights(_DATASET, {}, "Which region sells most?", llm)
+    _assert_insights(result, **_INSIGHTS)
+    assert "Which region sells most?" in result["prompt"]
+    assert len(llm.calls) == 1
+
+
+# (id, dataset, llm present?, expected summary) for inputs that never reach the LLM.
+_SHORT_CIRCUIT_CASES = [
+    ("empty", {"columns": ["a"], "rows": []}, True, "No data returned from query"),
+    ("single-row", {"columns": ["a"], "rows": [[1]]}, True,
+     "Single record returned, no patterns to analyze"),
+    ("unsupported", "not a dataset", True, "Unsupported dataset format"),
+    ("no-llm", _DATASET, False, "LLM service not available"),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "dataset,with_llm,expected",
+    [case[1:] for case in _SHORT_CIRCUIT_CASES],
+    ids=[case[0] for case in _SHORT_CIRCUIT_CASES],
+)
+async def test_generate_insights_short_circuits(dataset, with_llm, expected):
+    llm = _fake_llm(_INSIGHTS_JSON)
+    result = await generate_insights(dataset, {}, "q", llm if with_llm else None)
+    _assert_insights(result, summary=expected, findings=[], suggestions=[])
+    assert llm.calls == []
+
+
+@pytest.mark.asyncio
+async def test_generate_insights_reports_llm_error():
+    async def generate(**kwargs):
+        raise RuntimeError("LLM error")
+
+    result = await generate_insights(_DATASET, {}, "q", SimpleNamespace(generate=generate))
+    _assert_insights(
+        result, summary="Unable to generate insights", findings=["Error: LLM error"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_generate_insights_is_safe_under_concurrency():
+    llm = _fake_llm(_INSIGHTS_JSON)
+    questions = [f"question {i}" for i in range(32)]
+    results = await _bulk_generate(llm, questions)
+    assert len(llm.calls) == 32
+    for question, result in zip(questions, results):
+        _assert_insights(result, **_INSIGHTS)
+        assert result["prompt"].count(question + "\n") == 1
@@ -0,0 +1,75 @@
+"""Tests for `src.api.routes.insights` (non-streaming endpoint).
+
+The agent is a plain object, not a mock: its metadata loader serves a
+canned bundle and its LLM returns canned JSON, which is all the route
+reads from them.
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+
+import orjson
+
+_BUNDLE = MappingProxyType({"business_terms": "Revenue excludes refunds"})
+_LLM_CONTENT = orjson.dumps({
+    "summary": "North leads sales",
+    "findings": ["North is 40% above average"],
+    "suggestions": [],
+}).decode()
+
+_PAYLOAD = {
+    "connection": "sales_db",
+    "question": "Which region sells most?",
+    "dataset": {"columns": ["region", "sales"], "rows": [["north", 140], ["south", 90]]},
+}
+
+
+class _FakeMetadataLoader:
+    def __init__(self):
+        self.loaded = []
+
+    async def load_all(self, source_key):
+        self.loaded.append(source_key)
+        return _BUNDLE
+
+
+class _FakeLLM:
+    async def generate(self, **kwargs):
+        return {"content": _LLM_CONTENT}
+
+
+class _FakeAgent:
+    source_key = "sales_db"
+
+    def __init__(self):
+        self.metadata_loader = _FakeMetadataLoader()
+        self.llm = _FakeLLM()
+
+
+def _install_agent(fake_state) -> _FakeAgent:
+    agent = _FakeAgent()
+
+    async def get_agent(source_key):
+        return agent
+
+    fake_state.agent_registry.get_agent = get_agent
+    return agent
+
+
+def test_generate_insights_uses_bundle_as_context(client, fake_state):
+    agent = _install_agent(fake_state)
+
+    resp = client.post("/api/generate-insights", json=_PAYLOAD)
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["summary"] == "North leads sales"
+    assert body["findings"] == ["North is 40% above average"]
+    assert "- Revenue excludes refunds" in body["prompt"]
+    assert agent.metadata_loader.loaded == ["sales_db"]
+
+
+def test_generate_insights_returns_503_when_registry_missing(client, empty_state):
+    resp = client.post("/api/generate-insights", json=_PAYLOAD)
+    assert resp.status_code == 503
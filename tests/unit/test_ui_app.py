@@ -0,0 +1,402 @@
+"""Tests for the Flask proxy in `src.ui_app`.
+
+The backend is never contacted: `SESSION` is swapped for a fake that
+returns canned `requests.Response` objects and records what was sent.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import brotli
+import orjson
+import pytest
+import redis
+import requests
+
+from src import ui_app
+
+
+def _response(body, status: int = 200, content_type: str = "application/json") -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status
+    resp.raw = io.BytesIO(body if isinstance(body, bytes) else orjson.dumps(body))
+    resp.headers["Content-Type"] = content_type
+    return resp
+
+
+class _FakeSession:
+    def __init__(self):
+        self.calls = []
+        self.responses = []
+
+    def _next(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        result = self.responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def request(self, method, url, **kwargs):
+        return self._next(method, url, **kwargs)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    fake = _FakeSession()
+    monkeypatch.setattr(ui_app, "SESSION", fake)
+    monkeypatch.setattr(ui_app, "PROBE_SESSION", fake)
+    return fake
+
+
+@pytest.fixture
+def rcache(monkeypatch):
+    fake = _FakeRedis()
+    monkeypatch.setattr(ui_app, "RCACHE", fake)
+    return fake
+
+
+@pytest.fixture
+def ui_client():
+    return ui_app.app.test_client()
+
+
+@pytest.fixture
+def live_backend(monkeypatch):
+    """A real local HTTP server behind the real pooled SESSION.
+
+    Set `reply` to the (status, body) to answer with and `delay` to stall
+    before answering; `hits` counts requests received.
+    """
+
+    class _Backend:
+        reply = (200, b"{}")
+        delay = 0.0
+        hits = 0
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            _Backend.hits += 1
+            time.sleep(_Backend.delay)
+            status, body = _Backend.reply
+            try:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except OSError:
+                pass  # client gave up (read timeout)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    monkeypatch.setattr(ui_app, "API_BASE_URL", f"http://127.0.0.1:{server.server_port}")
+    yield _Backend
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_is_pooled():
+    adapter = ui_app.SESSION.get_adapter(ui_app.API_BASE_URL)
+    assert adapter._pool_maxsize == 50
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.read == 0
+    assert ui_app.SESSION.trust_env is False
+    assert ui_app.SESSION.cookies.get_policy().allowed_domains() == ()
+
+
+@pytest.mark.parametrize("path", ["/api/connections", "/api/tables?connection=sales"])
+def test_backend_503_is_relayed_once(live_backend, ui_client, path):
+    live_backend.reply = (503, b'{"detail": "Agent registry not ready"}')
+    resp = ui_client.get(path)
+    assert resp.status_code == 503
+    assert "Agent registry not ready" in resp.get_json()["error"]
+    assert live_backend.hits == 1
+
+
+def test_ask_forwards_payload(backend, ui_client):
+    backend.responses.append(_response({"sql": "SELECT 1"}))
+    resp = ui_client.post("/api/ask", json={"question": " hi ", "connection": "sales"})
+    assert resp.status_code == 200
+    assert resp.get_json() == {"sql": "SELECT 1"}
+    method, url, kwargs = backend.calls[0]
+    assert (method, url) == ("POST", f"{ui_app.API_BASE_URL}/api/query")
+    assert orjson.loads(kwargs["data"]) == {"question": "hi", "connection": "sales"}
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+
+
+def test_ask_requires_connection(backend, ui_client):
+    resp = ui_client.post("/api/ask", json={"question": "hi"})
+    assert resp.status_code == 400
+    assert backend.calls == []
+
+
+def test_upstream_error_is_surfaced(backend, ui_client):
+    backend.responses.append(_response(b"boom", status=500, content_type="text/plain"))
+    resp = ui_client.get("/api/tables?connection=sales")
+    assert resp.status_code == 500
+    assert resp.get_json() == {"error": "boom"}
+
+
+def test_backend_unavailable_returns_503(backend, ui_client):
+    backend.responses.append(requests.exceptions.ConnectionError("refused"))
+    resp = ui_client.get("/api/connections")
+    assert resp.status_code == 503
+    assert "Backend unavailable" in resp.get_json()["error"]
+
+
+def test_profile_body_is_passed_through(backend, ui_client):
+    html = b'{"html": "<html>' + b"x" * 200_000 + b'</html>"}'
+    backend.responses.append(_response(html))
+    resp = ui_client.post("/api/generate-profile", json={"dataset": {}})
+    assert resp.status_code == 200
+    assert resp.is_streamed
+    assert resp.data == html
+    assert backend.calls[0][2]["stream"] is True
+
+
+def test_chart_response_is_cached(backend, rcache, ui_client):
+    backend.responses.append(_response({"chart_config": {"series": []}}))
+    payload = {"connection": "sales", "columns": ["a"], "chart_type": "bar"}
+    first = ui_client.post("/api/generate-chart", json=payload)
+    second = ui_client.post("/api/generate-chart", json=payload)
+    assert first.get_json() == second.get_json() == {"chart_config": {"series": []}}
+    assert len(backend.calls) == 1
+    assert len(rcache.store) == 1
+
+
+def test_cache_false_bypasses_cache(backend, rcache, ui_client):
+    backend.responses.extend([_response({"n": 1}), _response({"n": 2})])
+    payload = {"connection": "sales", "columns": ["a"]}
+    ui_client.post("/api/generate-chart", json=payload)
+    resp = ui_client.post("/api/generate-chart?cache=false", json=payload)
+    assert resp.get_json() == {"n": 2}
+    assert len(backend.calls) == 2
+
+
+def test_forced_chart_regeneration_bypasses_cache(backend, rcache, ui_client):
+    # chartManager.js drops its sessionStorage entry when the chart type
+    # changes; the request it sends then must skip the Redis copy as well.
+    script = ui_client.get("/static/chart-feature/chartManager.js")
+    source = script.get_data(as_text=True)
+    script.close()
+    assert "force ? '/api/generate-chart?cache=false'" in source
+    assert "generateChartWithLLM(chartType, { force: true })" in source
+
+    backend.responses.extend([_response({"n": 1}), _response({"n": 2})])
+    payload = {"connection": "sales", "columns": ["a"], "chart_type": "bar"}
+    ui_client.post("/api/generate-chart", json=payload)
+    resp = ui_client.post("/api/generate-chart?cache=false", json=payload)
+    assert resp.get_json() == {"n": 2}
+    assert ui_client.post("/api/generate-chart", json=payload).get_json() == {"n": 2}
+    assert len(backend.calls) == 2
+
+
+@pytest.mark.parametrize(
+    "path,payload,body",
+    [
+        ("/api/ask", {"question": "hi", "connection": "sales", "session_id": "s1"},
+         {"error": "LLM timeout", "query_id": "q1"}),
+        ("/api/generate-insights", {"connection": "sales", "dataset": {"rows": []}},
+         {"summary": "Unable to generate insights", "findings": [], "suggestions": []}),
+        ("/api/generate-chart", {"connection": "sales", "columns": ["a"]},
+         {"error": "LLM timeout"}),
+    ],
+    ids=["ask", "insights", "chart-error-body"],
+)
+def test_failures_reported_as_200_are_not_cached(backend, rcache, ui_client, path, payload, body):
+    backend.responses.extend([_response(body), _response({"n": 2})])
+    first = ui_client.post(path, json=payload)
+    assert first.get_json() == body
+    first.close()
+    second = ui_client.post(path, json=payload)
+    assert second.get_json() == {"n": 2}
+    second.close()
+    assert len(backend.calls) == 2
+    # Only the chart route caches at all, and only the healthy answer.
+    expected = [{"n": 2}] if path == "/api/generate-chart" else []
+    assert [orjson.loads(v) for v in rcache.store.values()] == expected
+
+
+def test_schema_is_browser_cacheable(backend, ui_client):
+    backend.responses.extend([_response({"columns": []}), _response({"tables": []})])
+    schema = ui_client.get("/api/schema/orders?connection=sales")
+    schema.close()
+    rich = ui_client.get("/api/tables-rich?connection=sales")
+    rich.close()
+    assert schema.headers["Cache-Control"] == ui_app.METADATA_CACHE_CONTROL
+    assert "Cache-Control" not in rich.headers
+
+
+def test_index_is_rendered_once(monkeypatch, ui_client):
+    monkeypatch.setattr(ui_app, "_INDEX_HTML", None)
+    renders = []
+    real_render = ui_app.render_template
+    monkeypatch.setattr(
+        ui_app, "render_template", lambda name: renders.append(name) or real_render(name)
+    )
+    first = ui_client.get("/")
+    second = ui_client.get("/")
+    assert first.data == second.data
+    assert b"/static/script.js" in first.data
+    assert first.headers["Cache-Control"] == "public, max-age=300"
+    assert renders == ["index.html"]
+
+
+@pytest.mark.skipif(os.getenv("JINJA_CACHE") is not None, reason="explicit cache dir")
+def test_template_cache_defaults_to_private_dir():
+    directory = ui_app.app.jinja_env.bytecode_cache.directory
+    assert os.path.basename(directory) == f"_jinja2-cache-{os.getuid()}"
+    assert os.stat(directory).st_mode & 0o077 == 0
+
+
+def test_tables_honours_if_none_match(backend, ui_client):
+    backend.responses.extend([_response({"tables": ["a"]}), _response({"tables": ["a"]})])
+    first = ui_client.get("/api/tables?connection=sales")
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    second = ui_client.get("/api/tables?connection=sales", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.data == b""
+
+
+def test_single_flight_shares_concurrent_result(monkeypatch):
+    flights = ui_app._SingleFlight()
+    release = threading.Event()
+    calls = []
+    results = []
+
+    def slow_fetch():
+        calls.append("leader")
+        release.wait(timeout=5)
+        return "schema"
+
+    def follower_fetch():
+        calls.append("follower")
+        return "duplicate"
+
+    leader = threading.Thread(target=lambda: results.append(flights.do("k", slow_fetch)))
+    leader.start()
+    while not calls:
+        time.sleep(0.001)
+    # Note when the follower starts waiting on the leader's future, so the
+    # leader is released only once the follower is provably coalesced.
+    in_flight = flights._calls["k"]
+    follower_waiting = threading.Event()
+    real_result = in_flight.result
+
+    def result(timeout=None):
+        follower_waiting.set()
+        return real_result(timeout)
+
+    monkeypatch.setattr(in_flight, "result", result)
+    follower = threading.Thread(target=lambda: results.append(flights.do("k", follower_fetch)))
+    follower.start()
+    assert follower_waiting.wait(timeout=5)
+    release.set()
+    leader.join()
+    follower.join()
+    assert calls == ["leader"]
+    assert results == ["schema", "schema"]
+    # Nothing is retained once the call completes.
+    assert flights.do("k", follower_fetch) == "duplicate"
+
+
+def test_health_probe_is_cached(backend, monkeypatch, ui_client):
+    monkeypatch.setitem(ui_app._health_cache, "expires", 0.0)
+    backend.responses.append(_response({"status": "healthy"}))
+    first = ui_client.get("/health")
+    second = ui_client.get("/health")
+    assert first.get_json() == second.get_json() == {
+        "ui_status": "healthy",
+        "backend_status": {"status": "healthy"},
+    }
+    assert len(backend.calls) == 1
+
+
+def test_health_failure_is_reported(backend, monkeypatch, ui_client):
+    monkeypatch.setitem(ui_app._health_cache, "expires", 0.0)
+    backend.responses.append(requests.exceptions.ConnectTimeout("slow"))
+    body = ui_client.get("/health").get_json()
+    assert body["ui_status"] == "healthy"
+    assert body["backend_status"]["status"] == "unhealthy"
+
+
+def test_health_probe_is_single_attempt(live_backend, monkeypatch, ui_client):
+    monkeypatch.setitem(ui_app._health_cache, "expires", 0.0)
+    live_backend.delay = 1.5
+    started = time.monotonic()
+    body = ui_client.get("/health").get_json()
+    elapsed = time.monotonic() - started
+    assert body["backend_status"]["status"] == "unhealthy"
+    assert live_backend.hits == 1
+    assert elapsed < 1.0
+
+
+def test_get_read_timeout_is_not_retried(live_backend):
+    live_backend.delay = 0.6
+    with pytest.raises(requests.exceptions.RequestException, match="timed out"):
+        ui_app._send("GET", "/api/tables", timeout=0.3)
+    assert live_backend.hits == 1
+
+
+def test_large_json_is_compressed(backend, ui_client):
+    backend.responses.append(_response({"rows": [[i, "x" * 20] for i in range(500)]}))
+    resp = ui_client.post(
+        "/api/generate-profile", json={"dataset": {}}, headers={"Accept-Encoding": "br, gzip"}
+    )
+    assert resp.headers["Content-Encoding"] == "br"
+    assert orjson.loads(brotli.decompress(resp.data))["rows"][0] == [0, "x" * 20]
+
+
+def test_sse_stream_is_not_compressed(backend, ui_client):
+    backend.responses.append(_response(b"data: {}\n\n" * 200, content_type="text/event-stream"))
+    resp = ui_client.post(
+        "/api/generate-insights/stream",
+        json={"connection": "sales"},
+        headers={"Accept-Encoding": "br, gzip"},
+    )
+    assert "Content-Encoding" not in resp.headers
+    assert resp.data.startswith(b"data: {}")
+
+
+def test_redis_failure_backs_off(backend, monkeypatch, ui_client):
+    class _DownRedis:
+        calls = 0
+
+        def get(self, key):
+            _DownRedis.calls += 1
+            raise redis.ConnectionError("down")
+
+    monkeypatch.setattr(ui_app, "RCACHE", _DownRedis())
+    monkeypatch.setattr(ui_app, "_cache_skip_until", 0.0)
+    backend.responses.extend([_response({"n": 1}), _response({"n": 2})])
+    payload = {"connection": "sales", "columns": ["a"]}
+    assert ui_client.post("/api/generate-chart", json=payload).get_json() == {"n": 1}
+    assert ui_client.post("/api/generate-chart", json=payload).get_json() == {"n": 2}
+    assert _DownRedis.calls == 1
+
+
+def test_sse_backend_unavailable_returns_503(backend, ui_client):
+    backend.responses.append(requests.exceptions.ConnectionError("refused"))
+    resp = ui_client.post("/api/generate-insights/stream", json={"connection": "sales"})
+    assert resp.status_code == 503